@@ -19,61 +19,61 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database (participants are sets for fast lookup)
 activities = {
     "Football Team": {
         "description": "Join the varsity football team and compete in regional matches",
         "schedule": "Mondays, Wednesdays, Fridays, 4:00 PM - 6:00 PM",
         "max_participants": 25,
-        "participants": ["liam@mergington.edu", "jackson@mergington.edu"]
+        "participants": {"liam@mergington.edu", "jackson@mergington.edu"}
     },
     "Swimming": {
         "description": "Competitive swimming training and meets",
         "schedule": "Tuesdays and Thursdays, 6:00 AM - 7:30 AM",
         "max_participants": 15,
-        "participants": ["ava@mergington.edu", "mia@mergington.edu"]
+        "participants": {"ava@mergington.edu", "mia@mergington.edu"}
     },
     "Drama Club": {
         "description": "Theater production, acting workshops, and stage design",
         "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["lucas@mergington.edu", "isabella@mergington.edu"]
+        "participants": {"lucas@mergington.edu", "isabella@mergington.edu"}
     },
     "Art Workshop": {
         "description": "Painting, sketching, and sculpture for all skill levels",
         "schedule": "Mondays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["zoe@mergington.edu", "mason@mergington.edu"]
+        "participants": {"zoe@mergington.edu", "mason@mergington.edu"}
     },
     "Debate Team": {
         "description": "Structured argumentation on current events and philosophical topics",
         "schedule": "Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 10,
-        "participants": ["ethan@mergington.edu", "charlotte@mergington.edu"]
+        "participants": {"ethan@mergington.edu", "charlotte@mergington.edu"}
     },
     "Science Olympiad": {
         "description": "Preparation for competitive science tournaments",
         "schedule": "Tuesdays, 3:45 PM - 5:15 PM",
         "max_participants": 12,
-        "participants": ["noah@mergington.edu", "amelia@mergington.edu"]
+        "participants": {"noah@mergington.edu", "amelia@mergington.edu"}
     },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
@@ -85,7 +85,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as a set; send them as a sorted list
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -101,7 +105,7 @@ def signup_for_activity(activity_name: str, email: str):
     if email in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student already signed up")
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
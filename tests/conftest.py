@@ -0,0 +1,43 @@
+"""
+Shared fixtures for High School Management System API tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.app import app, activities
+
+# The set of activities is fixed at import time, so iterate a cached list
+# rather than a fresh dict view on every test
+_activity_items = list(activities.items())
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client shared by the whole test session"""
+    # Entering the client runs the app's lifespan once for the session
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def pristine_participants():
+    """Snapshot each activity's participants set and its contents once"""
+    return {
+        name: (activity["participants"], activity["participants"].copy())
+        for name, activity in _activity_items
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(pristine_participants):
+    """Reset activities data after each test"""
+    yield
+    
+    # Only touch activities whose participants set was replaced or changed
+    for name, activity in _activity_items:
+        participants, original = pristine_participants[name]
+        if activity["participants"] is participants and participants == original:
+            continue
+        activity["participants"] = participants
+        participants.clear()
+        participants.update(original)
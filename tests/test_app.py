@@ -2,222 +2,191 @@
 Tests for High School Management System API
 """
 
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_participants = {
-        name: activity["participants"].copy()
-        for name, activity in activities.items()
-    }
-    
-    yield
-    
-    # Restore original state after each test
-    for name, activity in activities.items():
-        activity["participants"] = original_participants[name].copy()
-
-
-class TestRootEndpoint:
-    """Tests for root endpoint"""
-    
-    def test_root_redirects_to_static(self, client):
-        """Test that root redirects to static index.html"""
-        response = client.get("/", follow_redirects=False)
-        assert response.status_code == 307
-        assert response.headers["location"] == "/static/index.html"
-
-
-class TestGetActivities:
-    """Tests for GET /activities endpoint"""
-    
-    def test_get_activities_returns_all_activities(self, client):
-        """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert isinstance(data, dict)
-        assert "Football Team" in data
-        assert "Swimming" in data
-        assert "Drama Club" in data
-        
-    def test_activity_structure(self, client):
-        """Test that each activity has the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity_details in data.items():
-            assert "description" in activity_details
-            assert "schedule" in activity_details
-            assert "max_participants" in activity_details
-            assert "participants" in activity_details
-            assert isinstance(activity_details["participants"], list)
-
-
-class TestSignupEndpoint:
-    """Tests for POST /activities/{activity_name}/signup endpoint"""
-    
-    def test_signup_success(self, client):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Football%20Team/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
-        
-        # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Football Team"]["participants"]
-    
-    def test_signup_duplicate_email(self, client):
-        """Test that duplicate signup fails"""
-        email = "duplicate@mergington.edu"
-        
-        # First signup should succeed
-        response1 = client.post(
-            f"/activities/Swimming/signup?email={email}"
-        )
-        assert response1.status_code == 200
-        
-        # Second signup with same email should fail
-        response2 = client.post(
-            f"/activities/Swimming/signup?email={email}"
-        )
-        assert response2.status_code == 400
-        data = response2.json()
-        assert "already signed up" in data["detail"]
-    
-    def test_signup_invalid_activity(self, client):
-        """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Invalid%20Activity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-
-
-class TestUnregisterEndpoint:
-    """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
-    
-    def test_unregister_success(self, client):
-        """Test successful unregister from an activity"""
-        # First, add a participant
-        email = "test@mergington.edu"
-        client.post(f"/activities/Chess%20Club/signup?email={email}")
-        
-        # Then unregister
-        response = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert email in data["message"]
-        
-        # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data["Chess Club"]["participants"]
-    
-    def test_unregister_not_registered(self, client):
-        """Test unregister when participant is not in activity"""
-        response = client.delete(
-            "/activities/Art%20Workshop/unregister?email=notregistered@mergington.edu"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "Student not found" in data["detail"]
-    
-    def test_unregister_invalid_activity(self, client):
-        """Test unregister from non-existent activity"""
-        response = client.delete(
-            "/activities/Invalid%20Activity/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-    
-    def test_unregister_existing_participant(self, client):
-        """Test unregister an existing participant"""
-        # Get initial participants
-        activities_response = client.get("/activities")
-        initial_data = activities_response.json()
-        initial_participant = initial_data["Football Team"]["participants"][0]
-        
-        # Unregister the participant
-        response = client.delete(
-            f"/activities/Football%20Team/unregister?email={initial_participant}"
-        )
-        assert response.status_code == 200
-        
-        # Verify participant was removed
-        activities_response = client.get("/activities")
-        updated_data = activities_response.json()
-        assert initial_participant not in updated_data["Football Team"]["participants"]
-
-
-class TestIntegrationScenarios:
-    """Integration tests for complete workflows"""
-    
-    def test_signup_and_unregister_flow(self, client):
-        """Test complete flow of signup and unregister"""
-        email = "integration@mergington.edu"
-        activity = "Programming Class"
-        
-        # Get initial count
-        initial_response = client.get("/activities")
-        initial_count = len(initial_response.json()[activity]["participants"])
-        
-        # Signup
-        signup_response = client.post(
-            f"/activities/{activity.replace(' ', '%20')}/signup?email={email}"
-        )
-        assert signup_response.status_code == 200
-        
-        # Check count increased
-        after_signup = client.get("/activities")
-        assert len(after_signup.json()[activity]["participants"]) == initial_count + 1
-        
-        # Unregister
-        unregister_response = client.delete(
-            f"/activities/{activity.replace(' ', '%20')}/unregister?email={email}"
-        )
-        assert unregister_response.status_code == 200
-        
-        # Check count returned to original
-        after_unregister = client.get("/activities")
-        assert len(after_unregister.json()[activity]["participants"]) == initial_count
-    
-    def test_multiple_activities_signup(self, client):
-        """Test signing up for multiple activities"""
-        email = "multitask@mergington.edu"
-        activities_to_join = ["Drama Club", "Art Workshop", "Chess Club"]
-        
-        for activity in activities_to_join:
-            response = client.post(
-                f"/activities/{activity.replace(' ', '%20')}/signup?email={email}"
-            )
-            assert response.status_code == 200
-        
-        # Verify participant is in all activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
-        for activity in activities_to_join:
-            assert email in activities_data[activity]["participants"]
+from fastapi import HTTPException
+from src.app import activities, signup_for_activity, unregister_from_activity
+
+# URL-encoded activity names, computed once at import time
+ENCODED = {name: quote(name, safe="") for name in activities}
+
+# Endpoint path builders, called as SIGNUP(encoded_activity); the email is
+# passed separately as params={"email": ...} so httpx encodes it
+SIGNUP = "/activities/{}/signup".format
+UNREGISTER = "/activities/{}/unregister".format
+
+
+# Tests for root endpoint
+def test_root_redirects_to_static(client):
+    """Test that root redirects to static index.html"""
+    response = client.get("/", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "/static/index.html"
+
+
+# Tests for GET /activities endpoint
+def test_get_activities_returns_all_activities(client):
+    """Test that GET /activities returns all activities"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert isinstance(data, dict)
+    assert "Football Team" in data
+    assert "Swimming" in data
+    assert "Drama Club" in data
+
+
+def test_activity_structure(client):
+    """Test that each activity has the correct structure"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    data = response.json()
+    
+    for activity_name, activity_details in data.items():
+        assert "description" in activity_details
+        assert "schedule" in activity_details
+        assert "max_participants" in activity_details
+        assert "participants" in activity_details
+        assert isinstance(activity_details["participants"], list)
+        assert activity_details["participants"] == sorted(activity_details["participants"])
+
+
+# Tests for POST /activities/{activity_name}/signup endpoint
+def test_signup_success(client):
+    """Test successful signup for an activity"""
+    response = client.post(
+        SIGNUP(ENCODED["Football Team"]), params={"email": "newstudent@mergington.edu"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert "message" in data
+    assert "newstudent@mergington.edu" in data["message"]
+    
+    # Verify participant was added
+    assert "newstudent@mergington.edu" in activities["Football Team"]["participants"]
+
+
+def test_signup_email_with_plus(client):
+    """Test that an email containing '+' reaches the API unchanged"""
+    email = "new+student@mergington.edu"
+    response = client.post(SIGNUP(ENCODED["Drama Club"]), params={"email": email})
+    assert response.status_code == 200
+    assert email in activities["Drama Club"]["participants"]
+
+
+def test_signup_duplicate_email(client):
+    """Test that duplicate signup fails"""
+    email = "duplicate@mergington.edu"
+    
+    # First signup should succeed
+    response1 = client.post(
+        SIGNUP(ENCODED["Swimming"]), params={"email": email}
+    )
+    assert response1.status_code == 200
+    
+    # Second signup with same email should fail
+    response2 = client.post(
+        SIGNUP(ENCODED["Swimming"]), params={"email": email}
+    )
+    assert response2.status_code == 400
+    data = response2.json()
+    assert "already signed up" in data["detail"]
+
+
+# Tests for DELETE /activities/{activity_name}/unregister endpoint
+def test_unregister_success(client):
+    """Test successful unregister from an activity"""
+    # First, add a participant
+    email = "test@mergington.edu"
+    client.post(SIGNUP(ENCODED["Chess Club"]), params={"email": email})
+    
+    # Then unregister
+    response = client.delete(
+        UNREGISTER(ENCODED["Chess Club"]), params={"email": email}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert "message" in data
+    assert email in data["message"]
+    
+    # Verify participant was removed
+    assert email not in activities["Chess Club"]["participants"]
+
+
+def test_unregister_existing_participant(client):
+    """Test unregister an existing participant"""
+    # Get initial participants
+    activities_response = client.get("/activities")
+    assert activities_response.status_code == 200
+    initial_data = activities_response.json()
+    initial_participant = initial_data["Football Team"]["participants"][0]
+    
+    # Unregister the participant
+    response = client.delete(
+        UNREGISTER(ENCODED["Football Team"]), params={"email": initial_participant}
+    )
+    assert response.status_code == 200
+    
+    # Verify participant was removed
+    assert initial_participant not in activities["Football Team"]["participants"]
+
+
+# Tests for error responses shared by the signup and unregister endpoints
+@pytest.mark.parametrize("method,url,email,status,message", [
+    ("post", SIGNUP(quote("Invalid Activity", safe="")), "test@mergington.edu",
+     404, "Activity not found"),
+    ("delete", UNREGISTER(quote("Invalid Activity", safe="")), "test@mergington.edu",
+     404, "Activity not found"),
+    ("delete", UNREGISTER(ENCODED["Art Workshop"]), "notregistered@mergington.edu",
+     400, "Student not found"),
+], ids=["signup-invalid-activity", "unregister-invalid-activity", "unregister-not-registered"])
+def test_error_response(client, method, url, email, status, message):
+    """Test that invalid requests return the expected status and detail"""
+    response = client.request(method, url, params={"email": email})
+    assert response.status_code == status
+    data = response.json()
+    assert message in data["detail"]
+
+
+# Integration tests for complete workflows, calling the handlers directly
+def test_signup_and_unregister_flow():
+    """Test complete flow of signup and unregister"""
+    email = "integration@mergington.edu"
+    activity = "Programming Class"
+    
+    # Get initial count
+    initial_count = len(activities[activity]["participants"])
+    
+    # Signup
+    signup_result = signup_for_activity(activity, email)
+    assert email in signup_result["message"]
+    
+    # Check count increased
+    assert len(activities[activity]["participants"]) == initial_count + 1
+    
+    # Unregister
+    unregister_result = unregister_from_activity(activity, email)
+    assert email in unregister_result["message"]
+    
+    # Check count returned to original
+    assert len(activities[activity]["participants"]) == initial_count
+    
+    # Unregistering again should fail
+    with pytest.raises(HTTPException) as exc_info:
+        unregister_from_activity(activity, email)
+    assert exc_info.value.status_code == 400
+
+
+def test_multiple_activities_signup():
+    """Test signing up for multiple activities"""
+    email = "multitask@mergington.edu"
+    activities_to_join = ["Drama Club", "Art Workshop", "Chess Club"]
+    
+    for activity in activities_to_join:
+        signup_for_activity(activity, email)
+    
+    # Verify participant is in all activities
+    for activity in activities_to_join:
+        assert email in activities[activity]["participants"]